@@ -1,8 +1,10 @@
 import pygame
+import numpy as np
 import random
 import math
 import sys
 import os
+from collections import defaultdict
 from enum import Enum
 from dataclasses import dataclass
 
@@ -17,6 +19,7 @@ class Config:
     SCREEN_WIDTH: int = 800
     SCREEN_HEIGHT: int = 600
     FPS: int = 60
+    MS_PER_FRAME: float = 1000 / FPS
     BG_COLOR: tuple = (0, 0, 20)
     PLAYER_SPEED: int = 5
     BULLET_SPEED: int = 10
@@ -58,19 +61,41 @@ class GameState(Enum):
     UPGRADE = "upgrade"
 
 
-class Entity(pygame.sprite.Sprite):
+class Entity(pygame.sprite.DirtySprite):
     """Base class for all game entities"""
 
+    # pygame's Sprite has no __slots__ of its own, so its bookkeeping
+    # attributes are declared here too to keep instance dicts empty
+    __slots__ = (
+        "image", "rect", "health", "max_health",
+        "_Sprite__g", "dirty", "blendmode", "_visible", "_layer", "source_rect"
+    )
+
+    # Surfaces are shared between all entities of the same size and color
+    _IMAGES = {}
+
     def __init__(self, x, y, width, height, color):
         super().__init__()
-        self.image = pygame.Surface((width, height))
-        self.image.fill(color)
+        self.image = self._get_image(width, height, color)
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
         self.health = 1
         self.max_health = 1
 
+    @classmethod
+    def _get_image(cls, width, height, color):
+        key = (width, height, color)
+        image = cls._IMAGES.get(key)
+        if image is None:
+            image = pygame.Surface((width, height))
+            # Match the display format so blits need no per-pixel conversion
+            if pygame.display.get_surface() is not None:
+                image = image.convert()
+            image.fill(color)
+            cls._IMAGES[key] = image
+        return image
+
     def draw_health(self, surface):
         if self.health < self.max_health:
             health_width = self.rect.width * (self.health / self.max_health)
@@ -79,6 +104,11 @@ class Entity(pygame.sprite.Sprite):
 
 
 class Player(Entity):
+    __slots__ = (
+        "speed", "bullets", "shoot_delay", "last_shot", "upgrades",
+        "shield_active", "shield_timer", "shield_duration"
+    )
+
     def __init__(self):
         super().__init__(
             Config.SCREEN_WIDTH // 2 - 25,
@@ -101,8 +131,10 @@ class Player(Entity):
         self.shield_timer = 0
         self.shield_duration = 3000  # 3 seconds
 
-    def update(self):
-        keys = pygame.key.get_pressed()
+    def update(self, keys=None):
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        old_pos = self.rect.topleft
         if keys[pygame.K_LEFT] and self.rect.left > 0:
             self.rect.x -= self.speed * self.upgrades["speed"]
         if keys[pygame.K_RIGHT] and self.rect.right < Config.SCREEN_WIDTH:
@@ -111,10 +143,12 @@ class Player(Entity):
             self.rect.y -= self.speed * self.upgrades["speed"]
         if keys[pygame.K_DOWN] and self.rect.bottom < Config.SCREEN_HEIGHT:
             self.rect.y += self.speed * self.upgrades["speed"]
+        if self.rect.topleft != old_pos:
+            self.dirty = 1
 
         # Update shield
         if self.shield_active:
-            self.shield_timer += 1000 / Config.FPS
+            self.shield_timer += Config.MS_PER_FRAME
             if self.shield_timer >= self.shield_duration:
                 self.shield_active = False
                 self.shield_timer = 0
@@ -123,7 +157,7 @@ class Player(Entity):
         now = pygame.time.get_ticks()
         if now - self.last_shot > self.shoot_delay / self.upgrades["fire_rate"]:
             self.last_shot = now
-            bullet = Bullet(self.rect.centerx, self.rect.top)
+            bullet = Bullet.spawn(self.rect.centerx, self.rect.top)
             bullet.damage *= self.upgrades["damage"]
             self.bullets.add(bullet)
             return bullet
@@ -136,56 +170,108 @@ class Player(Entity):
 
 
 class Bullet(Entity):
+    __slots__ = ("speed", "damage")
+
+    _pool = []  # Killed bullets, recycled by spawn()
+
     def __init__(self, x, y):
         super().__init__(x, y, 5, 15, Config.YELLOW)
+        self._reset(x, y)
+
+    @classmethod
+    def spawn(cls, x, y):
+        """Return a bullet at (x, y), reusing a killed one when possible"""
+        if cls._pool:
+            bullet = cls._pool.pop()
+            bullet._reset(x, y)
+            return bullet
+        return cls(x, y)
+
+    def _reset(self, x, y):
+        self.image = self._get_image(5, 15, Config.YELLOW)
         self.speed = Config.BULLET_SPEED
         self.damage = 10
         self.rect.centerx = x
         self.rect.bottom = y
+        self.dirty = 1
 
-    def update(self):
+    def kill(self):
+        if self.alive():
+            super().kill()
+            Bullet._pool.append(self)
+
+    def update(self, *args):
         self.rect.y -= self.speed
+        self.dirty = 1
         if self.rect.bottom < 0:
             self.kill()
 
 
 class Enemy(Entity):
+    __slots__ = ("speed", "difficulty", "manager", "idx")
+
+    SIZE = 40
+
+    _pool = []  # Killed managed enemies, recycled by spawn()
+
     def __init__(self, difficulty, x=None, y=None):
-        super().__init__(
-            x if x is not None else random.randrange(Config.SCREEN_WIDTH - 40),
-            y if y is not None else random.randrange(-100, -40),
-            40, 40, Config.RED
-        )
+        super().__init__(0, 0, self.SIZE, self.SIZE, Config.RED)
+        # Set while the enemy is moved by an EnemyManager
+        self.manager = None
+        self.idx = -1
+        self._reset(difficulty, x, y)
+
+    @classmethod
+    def spawn(cls, difficulty):
+        """Return a regular enemy, reusing a killed one when possible"""
+        if cls._pool:
+            enemy = cls._pool.pop()
+            enemy._reset(difficulty)
+            return enemy
+        return cls(difficulty)
+
+    def _reset(self, difficulty, x=None, y=None):
+        self.rect.x = x if x is not None else random.randrange(Config.SCREEN_WIDTH - self.SIZE)
+        self.rect.y = y if y is not None else random.randrange(-100, -40)
         self.speed = Config.ENEMY_SPEED * difficulty["speed"]
         self.health = difficulty["health"]
         self.max_health = difficulty["health"]
         self.difficulty = difficulty
 
-    def update(self):
-        self.rect.y += self.speed
-        if self.rect.top > Config.SCREEN_HEIGHT:
-            self.reset_position()
-
-    def reset_position(self):
-        self.rect.x = random.randrange(Config.SCREEN_WIDTH - self.rect.width)
-        self.rect.y = random.randrange(-100, -40)
+    def kill(self):
+        # Only enemies from an EnemyManager are pooled; bosses are not
+        if self.manager is not None:
+            self.manager.remove(self)
+            Enemy._pool.append(self)
+        super().kill()
 
 
 class Boss(Enemy):
+    # The movement patterns step their angle by 0.05 per tick of the integer
+    # pattern_timer, so sin/cos are looked up rather than computed. The timer
+    # never gets past ~300 (the entrance takes ~150 ticks and the patterns
+    # reset it at 200/300), well inside the tables.
+    _SIN = [math.sin(i * 0.05) for i in range(2520)]
+    _COS = [math.cos(i * 0.05) for i in range(2520)]
+
+    __slots__ = ("pattern", "pattern_timer", "attack_timer", "attack_delay", "_fx")
+
     def __init__(self, difficulty):
         super().__init__(difficulty, Config.SCREEN_WIDTH // 2 - 40, -100)
-        self.image = pygame.Surface((80, 80))
-        self.image.fill(Config.PURPLE)
+        self.image = self._get_image(80, 80, Config.PURPLE)
         self.health = 50 * difficulty["health"]
         self.max_health = self.health
         self.pattern = 0
         self.pattern_timer = 0
         self.attack_timer = 0
         self.attack_delay = 1000  # ms between attacks
+        # Exact horizontal position; rect.x only holds it rounded to pixels
+        self._fx = float(self.rect.x)
 
-    def update(self):
+    def update(self, *args):
         self.pattern_timer += 1
-        self.attack_timer += 1000 / Config.FPS
+        self.attack_timer += Config.MS_PER_FRAME
+        self.dirty = 1
 
         # Movement patterns
         if self.pattern == 0:  # Entrance
@@ -193,14 +279,15 @@ class Boss(Enemy):
             if self.rect.top > 50:
                 self.pattern = 1
         elif self.pattern == 1:  # Side-to-side
-            self.rect.x += math.sin(self.pattern_timer * 0.05) * 3
+            self._fx += self._SIN[self.pattern_timer] * 3
+            self.rect.x = round(self._fx)
             if self.pattern_timer > 200:
                 self.pattern = 2
                 self.pattern_timer = 0
         elif self.pattern == 2:  # Circular
-            angle = self.pattern_timer * 0.05
-            self.rect.x = Config.SCREEN_WIDTH // 2 + math.sin(angle) * 200
-            self.rect.y = 100 + math.cos(angle) * 50
+            self._fx = Config.SCREEN_WIDTH // 2 + self._SIN[self.pattern_timer] * 200
+            self.rect.x = round(self._fx)
+            self.rect.y = 100 + self._COS[self.pattern_timer] * 50
             if self.pattern_timer > 300:
                 self.pattern = 1
                 self.pattern_timer = 0
@@ -235,108 +322,220 @@ class StoryManager:
         return self.current_chapter < len(self.chapters)
 
 
-class QuadTree:
-    """Simple QuadTree implementation for collision optimization"""
-
-    def __init__(self, boundary, capacity):
-        self.boundary = boundary  # (x, y, width, height)
-        self.capacity = capacity
-        self.objects = []
-        self.divided = False
-
-    def subdivide(self):
-        x, y, w, h = self.boundary
-        nw = (x, y, w / 2, h / 2)
-        ne = (x + w / 2, y, w / 2, h / 2)
-        sw = (x, y + h / 2, w / 2, h / 2)
-        se = (x + w / 2, y + h / 2, w / 2, h / 2)
-
-        self.northwest = QuadTree(nw, self.capacity)
-        self.northeast = QuadTree(ne, self.capacity)
-        self.southwest = QuadTree(sw, self.capacity)
-        self.southeast = QuadTree(se, self.capacity)
-        self.divided = True
-
-    def insert(self, obj):
-        if not self._intersects(obj.rect):
-            return False
-
-        if len(self.objects) < self.capacity:
-            self.objects.append(obj)
-            return True
-
-        if not self.divided:
-            self.subdivide()
-
-        return (self.northwest.insert(obj) or
-                self.northeast.insert(obj) or
-                self.southwest.insert(obj) or
-                self.southeast.insert(obj))
-
-    def _intersects(self, rect):
-        x, y, w, h = self.boundary
-        return not (rect.right < x or
-                    rect.left > x + w or
-                    rect.bottom < y or
-                    rect.top > y + h)
-
-    def query(self, rect, found=None):
-        if found is None:
-            found = []
-
-        if not self._intersects(rect):
-            return found
-
-        for obj in self.objects:
-            if rect.colliderect(obj.rect):
-                found.append(obj)
-
-        if self.divided:
-            self.northwest.query(rect, found)
-            self.northeast.query(rect, found)
-            self.southwest.query(rect, found)
-            self.southeast.query(rect, found)
-
-        return found
+class ParticleSystem:
+    """Simple particle system for visual effects
 
+    Particles are kept as parallel NumPy arrays (one per attribute) so the
+    per-frame update is a handful of vectorized operations.
+    """
 
-class ParticleSystem:
-    """Simple particle system for visual effects"""
+    CAPACITY = 1024
+    MIN_SIZE = 2
+    MAX_SIZE = 5
 
     def __init__(self):
-        self.particles = []
+        self.n = 0
+        self._allocate(self.CAPACITY)
+        # Pre-rendered circles, indexed by the per-particle `sprite` array
+        self._circle_cache = {}  # (color, size) -> index into _circles
+        self._circles = []
+
+    def _allocate(self, capacity):
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.int16)
+        self.size = np.zeros(capacity, dtype=np.int8)
+        self.sprite = np.zeros(capacity, dtype=np.int16)
+
+    def _arrays(self):
+        return self.x, self.y, self.vx, self.vy, self.life, self.size, self.sprite
+
+    def _grow(self, needed):
+        old = self._arrays()
+        capacity = len(self.x)
+        while capacity < needed:
+            capacity *= 2
+        self._allocate(capacity)
+        n = self.n
+        for new, prev in zip(self._arrays(), old):
+            new[:n] = prev[:n]
+
+    def _circle_index(self, color, size):
+        key = (tuple(color), size)
+        index = self._circle_cache.get(key)
+        if index is None:
+            circle = pygame.Surface((2 * size + 1, 2 * size + 1), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(circle, color, (size, size), size)
+            index = len(self._circles)
+            self._circles.append(circle)
+            self._circle_cache[key] = index
+        return index
 
     def add_explosion(self, x, y, color, count=20):
-        for _ in range(count):
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': random.uniform(-3, 3),
-                'vy': random.uniform(-3, 3),
-                'life': random.randint(20, 40),
-                'color': color,
-                'size': random.randint(2, 5)
-            })
+        start, end = self.n, self.n + count
+        if end > len(self.x):
+            self._grow(end)
+        sizes = np.random.randint(self.MIN_SIZE, self.MAX_SIZE + 1, count)
+        circles = np.array([
+            self._circle_index(color, size)
+            for size in range(self.MIN_SIZE, self.MAX_SIZE + 1)
+        ])
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = np.random.uniform(-3, 3, count)
+        self.vy[start:end] = np.random.uniform(-3, 3, count)
+        self.life[start:end] = np.random.randint(20, 41, count)
+        self.size[start:end] = sizes
+        self.sprite[start:end] = circles[sizes - self.MIN_SIZE]
+        self.n = end
 
     def update(self):
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
+        n = self.n
+        if n == 0:
+            return
+        self.x[:n] += self.vx[:n]
+        self.y[:n] += self.vy[:n]
+        self.life[:n] -= 1
+
+        # Compact the survivors to the front of the arrays, in one O(n)
+        # pass and only on frames where something actually expired
+        alive = self.life[:n] > 0
+        if alive.all():
+            return
+        alive = np.flatnonzero(alive)
+        count = len(alive)
+        for values in self._arrays():
+            values[:count] = values[alive]
+        self.n = count
 
     def draw(self, surface):
-        for particle in self.particles:
-            pygame.draw.circle(
-                surface,
-                particle['color'],
-                (int(particle['x']), int(particle['y'])),
-                particle['size']
-            )
+        """Draw all particles and return the screen area they cover"""
+        n = self.n
+        if n == 0:
+            return []
+        size = self.size[:n]
+        left = self.x[:n].astype(np.int32) - size
+        top = self.y[:n].astype(np.int32) - size
+        circles = self._circles
+        # One blits() call for every particle instead of a draw.circle each
+        surface.blits([
+            (circles[sprite], (x, y))
+            for sprite, x, y in zip(self.sprite[:n].tolist(), left.tolist(), top.tolist())
+        ], doreturn=False)
+
+        right = int((left + 2 * size).max()) + 1
+        bottom = int((top + 2 * size).max()) + 1
+        left, top = int(left.min()), int(top.min())
+        return [pygame.Rect(left, top, right - left, bottom - top).clip(surface.get_rect())]
+
+
+class EnemyManager:
+    """Moves and draws regular enemies in bulk
+
+    Positions and speeds live in NumPy arrays indexed by `Enemy.idx`, so
+    a frame's movement is one vectorized add. The results are written back
+    to the sprite rects once per tick for collisions.
+    """
+
+    CAPACITY = 32
+
+    def __init__(self):
+        self.sprites = []
+        self._allocate(self.CAPACITY)
+
+    def _allocate(self, capacity):
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+
+    def _grow(self):
+        n = len(self.sprites)
+        old = self.x, self.y, self.vy
+        self._allocate(2 * len(self.x))
+        for new, prev in zip((self.x, self.y, self.vy), old):
+            new[:n] = prev[:n]
+
+    def add(self, enemy):
+        idx = len(self.sprites)
+        if idx == len(self.x):
+            self._grow()
+        self.x[idx], self.y[idx] = enemy.rect.topleft
+        self.vy[idx] = enemy.speed
+        enemy.manager = self
+        enemy.idx = idx
+        self.sprites.append(enemy)
+
+    def remove(self, enemy):
+        # Move the last enemy into the freed slot to keep the arrays dense
+        idx, last = enemy.idx, len(self.sprites) - 1
+        if idx != last:
+            moved = self.sprites[last]
+            self.sprites[idx] = moved
+            moved.idx = idx
+            for values in (self.x, self.y, self.vy):
+                values[idx] = values[last]
+        self.sprites.pop()
+        enemy.manager = None
+        enemy.idx = -1
+
+    def tick(self):
+        n = len(self.sprites)
+        if n == 0:
+            return
+        self.y[:n] += self.vy[:n]
+
+        # Enemies that left the bottom of the screen come back from the top
+        offscreen = np.flatnonzero(self.y[:n] > Config.SCREEN_HEIGHT)
+        if len(offscreen):
+            self.x[offscreen] = np.random.randint(0, Config.SCREEN_WIDTH - Enemy.SIZE, len(offscreen))
+            self.y[offscreen] = np.random.randint(-100, -40, len(offscreen))
+
+        xs, ys = self._positions(n)
+        for enemy, x, y in zip(self.sprites, xs.tolist(), ys.tolist()):
+            enemy.rect.topleft = (x, y)
+
+    def _positions(self, n):
+        """Integer positions of the first n enemies, as used by their rects"""
+        return np.rint(self.x[:n]).astype(np.int32), np.rint(self.y[:n]).astype(np.int32)
+
+    def collide(self, rect):
+        """Return the managed enemies whose rects overlap `rect`"""
+        n = len(self.sprites)
+        if n == 0:
+            return []
+        xs, ys = self._positions(n)
+        size = Enemy.SIZE
+        left, top, width, height = rect
+        hit = ((xs < left + width) & (xs + size > left) &
+               (ys < top + height) & (ys + size > top))
+        sprites = self.sprites
+        return [sprites[i] for i in np.flatnonzero(hit).tolist()]
+
+    def draw(self, surface):
+        """Blit every managed enemy in one call and return the rects covered"""
+        n = len(self.sprites)
+        if n == 0:
+            return []
+        # Regular enemies all share one surface
+        image = self.sprites[0].image
+        positions = np.column_stack(self._positions(n)).tolist()
+        return surface.blits([(image, position) for position in positions])
 
 
 class Game:
+    UPGRADE_OPTIONS = (
+        {"name": "Скорость", "type": "speed", "description": "+20% к скорости корабля"},
+        {"name": "Урон", "type": "damage", "description": "+20% к урону пуль"},
+        {"name": "Скорострельность", "type": "fire_rate", "description": "+20% к скорости стрельбы"},
+        {"name": "Щит", "type": "shield", "description": "Временная неуязвимость"}
+    )
+
+    # Bullet-enemy pairs above which collisions go through a spatial hash
+    COLLISION_GRID_THRESHOLD = 64
+    COLLISION_CELL_SHIFT = 6  # 64px cells
+
     def __init__(self):
         self.screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
         pygame.display.set_caption("Космический шутер")
@@ -350,12 +549,27 @@ class Game:
         self.state = GameState.MENU
         self.story_manager = StoryManager()
         self.particle_system = ParticleSystem()
-        self.quadtree = QuadTree((0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), 4)
+        self.background = pygame.Surface(self.screen.get_size()).convert()
+        self.background.fill(Config.BG_COLOR)
+        # Game screen is drawn with dirty rects; these track what to repaint
+        self._full_redraw = True
+        self._overlay_rects = []
+        self._text_cache = {}
+        self._hud_score = None
+        self._hud_level = None
+        self._score_text = None
+        self._level_text = None
         self.load_assets()
 
     def load_assets(self):
         """Load game assets (placeholder - implement actual asset loading)"""
         Config.init_assets()
+        # Build the shared entity surfaces now that the display exists
+        Entity._get_image(50, 40, Config.BLUE)
+        Entity._get_image(5, 15, Config.YELLOW)
+        Entity._get_image(5, 15, Config.PURPLE)
+        Entity._get_image(Enemy.SIZE, Enemy.SIZE, Config.RED)
+        Entity._get_image(80, 80, Config.PURPLE)
         # In a real game, you would load images and sounds here
         # Example:
         # self.player_image = pygame.image.load(os.path.join(Config.IMAGES_DIR, "player.png"))
@@ -364,7 +578,11 @@ class Game:
     def new_game(self):
         self.player = Player()
         self.enemies = pygame.sprite.Group()
-        self.all_sprites = pygame.sprite.Group(self.player)
+        self.enemy_manager = EnemyManager()
+        # Bosses and their bullets, which move on their own
+        self.unmanaged_enemies = pygame.sprite.Group()
+        self.all_sprites = pygame.sprite.LayeredDirty(self.player)
+        self.all_sprites.clear(self.screen, self.background)
         self.score = 0
         self.level = 1
         self.story_manager.current_chapter = 0
@@ -378,20 +596,32 @@ class Game:
         for i in range(count):
             if self.level % 5 == 0 and i == 0:  # Boss every 5 levels
                 enemy = Boss(diff)
+                self.unmanaged_enemies.add(enemy)
             else:
-                enemy = Enemy(diff)
+                enemy = Enemy.spawn(diff)
+                self.enemy_manager.add(enemy)
             self.enemies.add(enemy)
-            self.all_sprites.add(enemy)
+            if enemy.manager is None:
+                self.all_sprites.add(enemy)
+
+    def _text(self, font, text, color):
+        """Render text with antialiasing, reusing earlier renders of the same string"""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
 
     def show_menu(self):
-        self.screen.fill(Config.BG_COLOR)
+        self.screen.blit(self.background, (0, 0))
 
-        title = self.big_font.render("КОСМИЧЕСКИЙ ШУТЕР", True, Config.WHITE)
-        start = self.font.render("1 - Новая игра (Легко)", True, Config.GREEN)
-        start2 = self.font.render("2 - Новая игра (Нормально)", True, Config.YELLOW)
-        start3 = self.font.render("3 - Новая игра (Сложно)", True, Config.RED)
-        high_score = self.font.render(f"Рекорд: {self.high_score}", True, Config.WHITE)
-        quit_text = self.font.render("ESC - Выход", True, Config.WHITE)
+        title = self._text(self.big_font, "КОСМИЧЕСКИЙ ШУТЕР", Config.WHITE)
+        start = self._text(self.font, "1 - Новая игра (Легко)", Config.GREEN)
+        start2 = self._text(self.font, "2 - Новая игра (Нормально)", Config.YELLOW)
+        start3 = self._text(self.font, "3 - Новая игра (Сложно)", Config.RED)
+        high_score = self._text(self.font, f"Рекорд: {self.high_score}", Config.WHITE)
+        quit_text = self._text(self.font, "ESC - Выход", Config.WHITE)
 
         self.screen.blit(title, (Config.SCREEN_WIDTH // 2 - title.get_width() // 2, 100))
         self.screen.blit(start, (Config.SCREEN_WIDTH // 2 - start.get_width() // 2, 200))
@@ -403,18 +633,18 @@ class Game:
         pygame.display.flip()
 
     def show_story(self):
-        self.screen.fill(Config.BG_COLOR)
+        self.screen.blit(self.background, (0, 0))
         story_text = self.story_manager.get_current_story()
 
         if story_text:
             lines = story_text.split('\n')
             y_pos = 150
             for line in lines:
-                text = self.font.render(line, True, Config.WHITE)
+                text = self._text(self.font, line, Config.WHITE)
                 self.screen.blit(text, (Config.SCREEN_WIDTH // 2 - text.get_width() // 2, y_pos))
                 y_pos += 40
 
-            continue_text = self.font.render("Нажмите ПРОБЕЛ для продолжения", True, Config.YELLOW)
+            continue_text = self._text(self.font, "Нажмите ПРОБЕЛ для продолжения", Config.YELLOW)
             self.screen.blit(continue_text, (Config.SCREEN_WIDTH // 2 - continue_text.get_width() // 2, 450))
         else:
             self.state = GameState.GAME
@@ -422,35 +652,60 @@ class Game:
         pygame.display.flip()
 
     def show_hud(self):
-        score_text = self.font.render(f"Очки: {self.score}", True, Config.WHITE)
-        level_text = self.font.render(f"Уровень: {self.level}", True, Config.WHITE)
+        # Score and level change rarely, so only re-render them when they do
+        if self.score != self._hud_score:
+            self._hud_score = self.score
+            self._score_text = self.font.render(f"Очки: {self.score}", True, Config.WHITE)
+        if self.level != self._hud_level:
+            self._hud_level = self.level
+            self._level_text = self.font.render(f"Уровень: {self.level}", True, Config.WHITE)
 
         # Draw health bar
         health_width = 200 * (self.player.health / self.player.max_health)
-        pygame.draw.rect(self.screen, Config.RED, (10, 10, 200, 20))
+        rects = [pygame.draw.rect(self.screen, Config.RED, (10, 10, 200, 20))]
         pygame.draw.rect(self.screen, Config.GREEN, (10, 10, health_width, 20))
 
         # Draw shield indicator if active
         if self.player.shield_active:
-            shield_text = self.font.render("ЩИТ АКТИВЕН", True, Config.BLUE)
-            self.screen.blit(shield_text, (Config.SCREEN_WIDTH - 150, 10))
-
-        self.screen.blit(score_text, (10, 40))
-        self.screen.blit(level_text, (10, 70))
+            shield_text = self._text(self.font, "ЩИТ АКТИВЕН", Config.BLUE)
+            rects.append(self.screen.blit(shield_text, (Config.SCREEN_WIDTH - 150, 10)))
+
+        rects.append(self.screen.blit(self._score_text, (10, 40)))
+        rects.append(self.screen.blit(self._level_text, (10, 70)))
+        return rects
+
+    def draw_game(self):
+        """Draw the game screen, pushing only the changed areas to the display"""
+        if self._full_redraw:
+            self.all_sprites.repaint_rect(self.screen.get_rect())
+            self._full_redraw = False
+
+        # Regular enemies, particles and the HUD are drawn outside the sprite
+        # group, so erase last frame's copies
+        for rect in self._overlay_rects:
+            self.all_sprites.repaint_rect(rect)
+
+        rects = self.all_sprites.draw(self.screen)
+        self._overlay_rects = (
+            self.enemy_manager.draw(self.screen) +
+            self.particle_system.draw(self.screen) +
+            self.show_hud()
+        )
+        pygame.display.update(rects + self._overlay_rects)
 
     def check_collisions(self):
-        # Update quadtree
-        self.quadtree = QuadTree((0, 0, Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), 4)
-        for enemy in self.enemies:
-            self.quadtree.insert(enemy)
-
-        # Check bullet-enemy collisions using quadtree
-        for bullet in self.player.bullets:
-            potential_collisions = self.quadtree.query(bullet.rect)
-            for enemy in potential_collisions:
-                if pygame.sprite.collide_rect(bullet, enemy):
+        # Check bullet-enemy collisions. For the usual handful of sprites a
+        # flat rect test in pygame's C loop is cheapest; a spatial hash only
+        # pays off once there are many pairs to test.
+        # Frames without any bullets in flight skip it entirely.
+        if self.player.bullets:
+            if len(self.player.bullets) * len(self.enemies) < self.COLLISION_GRID_THRESHOLD:
+                hits = pygame.sprite.groupcollide(self.player.bullets, self.enemies, True, False)
+            else:
+                hits = self._grid_collide(self.player.bullets, self.enemies)
+            for bullet, enemies in hits.items():
+                for enemy in enemies:
                     enemy.health -= bullet.damage
-                    bullet.kill()
                     self.particle_system.add_explosion(
                         bullet.rect.centerx, bullet.rect.centery,
                         Config.YELLOW
@@ -470,8 +725,12 @@ class Game:
 
         # Player-enemy collisions
         if not self.player.shield_active:
-            hits = pygame.sprite.spritecollide(self.player, self.enemies, True)
+            # Regular enemies are tested in one vectorized pass over the
+            # manager's arrays; only the few unmanaged ones go sprite by sprite
+            hits = self.enemy_manager.collide(self.player.rect)
+            hits += pygame.sprite.spritecollide(self.player, self.unmanaged_enemies, False)
             for hit in hits:
+                hit.kill()
                 self.player.health -= 20
                 self.particle_system.add_explosion(
                     hit.rect.centerx, hit.rect.centery,
@@ -484,6 +743,39 @@ class Game:
         if len(self.enemies) == 0:
             self.level_complete()
 
+    def _grid_cells(self, rect):
+        shift = self.COLLISION_CELL_SHIFT
+        return [
+            (cx, cy)
+            for cx in range(rect.left >> shift, ((rect.right - 1) >> shift) + 1)
+            for cy in range(rect.top >> shift, ((rect.bottom - 1) >> shift) + 1)
+        ]
+
+    def _grid_collide(self, bullets, enemies):
+        """Spatial hash equivalent of groupcollide(bullets, enemies, True, False)"""
+        grid = defaultdict(list)
+        for enemy in enemies:
+            for cell in self._grid_cells(enemy.rect):
+                grid[cell].append(enemy)
+
+        hits = {}
+        for bullet in bullets.sprites():
+            rect = bullet.rect
+            found = []
+            for cell in self._grid_cells(rect):
+                for enemy in grid.get(cell, ()):
+                    if enemy not in found and rect.colliderect(enemy.rect):
+                        found.append(enemy)
+            if found:
+                bullet.kill()
+                hits[bullet] = found
+        return hits
+
+    def player_shoot(self):
+        bullet = self.player.shoot()
+        if bullet:
+            self.all_sprites.add(bullet)
+
     def level_complete(self):
         self.level += 1
         self.player.health = min(self.player.max_health, self.player.health + 20)
@@ -515,12 +807,6 @@ class Game:
 
     def show_upgrade_screen(self):
         self.state = GameState.UPGRADE
-        self.upgrade_options = [
-            {"name": "Скорость", "type": "speed", "description": "+20% к скорости корабля"},
-            {"name": "Урон", "type": "damage", "description": "+20% к урону пуль"},
-            {"name": "Скорострельность", "type": "fire_rate", "description": "+20% к скорости стрельбы"},
-            {"name": "Щит", "type": "shield", "description": "Временная неуязвимость"}
-        ]
 
     def apply_upgrade(self, upgrade_type):
         self.player.upgrades[upgrade_type] += 0.2
@@ -529,23 +815,23 @@ class Game:
         self.state = GameState.GAME
 
     def show_upgrade_menu(self):
-        self.screen.fill(Config.BG_COLOR)
-        title = self.font.render("Выберите улучшение:", True, Config.YELLOW)
+        self.screen.blit(self.background, (0, 0))
+        title = self._text(self.font, "Выберите улучшение:", Config.YELLOW)
         self.screen.blit(title, (Config.SCREEN_WIDTH // 2 - title.get_width() // 2, 100))
 
-        for i, option in enumerate(self.upgrade_options):
-            text = self.font.render(f"{i + 1} - {option['name']}: {option['description']}", True, Config.WHITE)
+        for i, option in enumerate(self.UPGRADE_OPTIONS):
+            text = self._text(self.font, f"{i + 1} - {option['name']}: {option['description']}", Config.WHITE)
             self.screen.blit(text, (Config.SCREEN_WIDTH // 2 - text.get_width() // 2, 200 + i * 50))
 
         pygame.display.flip()
 
     def show_game_over(self):
-        self.screen.fill(Config.BG_COLOR)
-        game_over_text = self.big_font.render("ИГРА ОКОНЧЕНА", True, Config.RED)
-        score_text = self.font.render(f"Ваш счет: {self.score}", True, Config.WHITE)
-        high_score_text = self.font.render(f"Рекорд: {self.high_score}", True, Config.YELLOW)
-        restart_text = self.font.render("Нажмите R для рестарта", True, Config.WHITE)
-        menu_text = self.font.render("ESC - Меню", True, Config.WHITE)
+        self.screen.blit(self.background, (0, 0))
+        game_over_text = self._text(self.big_font, "ИГРА ОКОНЧЕНА", Config.RED)
+        score_text = self._text(self.font, f"Ваш счет: {self.score}", Config.WHITE)
+        high_score_text = self._text(self.font, f"Рекорд: {self.high_score}", Config.YELLOW)
+        restart_text = self._text(self.font, "Нажмите R для рестарта", Config.WHITE)
+        menu_text = self._text(self.font, "ESC - Меню", Config.WHITE)
 
         self.screen.blit(game_over_text, (Config.SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, 150))
         self.screen.blit(score_text, (Config.SCREEN_WIDTH // 2 - score_text.get_width() // 2, 250))
@@ -556,12 +842,12 @@ class Game:
         pygame.display.flip()
 
     def show_victory_screen(self):
-        self.screen.fill(Config.BG_COLOR)
-        victory_text = self.big_font.render("ПОБЕДА!", True, Config.GREEN)
-        score_text = self.font.render(f"Ваш счет: {self.score}", True, Config.WHITE)
-        high_score_text = self.font.render(f"Рекорд: {self.high_score}", True, Config.YELLOW)
-        restart_text = self.font.render("Нажмите R для рестарта", True, Config.WHITE)
-        menu_text = self.font.render("ESC - Меню", True, Config.WHITE)
+        self.screen.blit(self.background, (0, 0))
+        victory_text = self._text(self.big_font, "ПОБЕДА!", Config.GREEN)
+        score_text = self._text(self.font, f"Ваш счет: {self.score}", Config.WHITE)
+        high_score_text = self._text(self.font, f"Рекорд: {self.high_score}", Config.YELLOW)
+        restart_text = self._text(self.font, "Нажмите R для рестарта", Config.WHITE)
+        menu_text = self._text(self.font, "ESC - Меню", Config.WHITE)
 
         self.screen.blit(victory_text, (Config.SCREEN_WIDTH // 2 - victory_text.get_width() // 2, 150))
         self.screen.blit(score_text, (Config.SCREEN_WIDTH // 2 - score_text.get_width() // 2, 250))
@@ -623,7 +909,7 @@ class Game:
                         self.new_game()
 
                     elif event.key == pygame.K_SPACE and self.state == GameState.GAME:
-                        self.player.shoot()
+                        self.player_shoot()
 
                     elif event.key == pygame.K_s and self.state == GameState.GAME:
                         self.player.activate_shield()
@@ -632,10 +918,11 @@ class Game:
             if self.state == GameState.GAME:
                 keys = pygame.key.get_pressed()
                 if keys[pygame.K_SPACE]:
-                    self.player.shoot()
+                    self.player_shoot()
 
-                self.all_sprites.update()
-                self.player.bullets.update()
+                # Key state is sampled once and shared with the player
+                self.all_sprites.update(keys)
+                self.enemy_manager.tick()
                 self.particle_system.update()
                 self.check_collisions()
 
@@ -643,32 +930,29 @@ class Game:
                 for enemy in self.enemies:
                     if isinstance(enemy, Boss) and enemy.update():  # Boss.update() returns True when attacking
                         # Boss shoots bullets
-                        bullet = Bullet(enemy.rect.centerx, enemy.rect.bottom)
+                        bullet = Bullet.spawn(enemy.rect.centerx, enemy.rect.bottom)
                         bullet.speed = -bullet.speed  # Enemy bullets go downward
-                        bullet.image.fill(Config.PURPLE)
+                        bullet.image = bullet._get_image(5, 15, Config.PURPLE)
                         self.all_sprites.add(bullet)
                         self.enemies.add(bullet)
+                        self.unmanaged_enemies.add(bullet)
 
             # Rendering
-            self.screen.fill(Config.BG_COLOR)
-
-            if self.state == GameState.MENU:
-                self.show_menu()
-            elif self.state == GameState.STORY:
-                self.show_story()
-            elif self.state == GameState.GAME:
-                self.all_sprites.draw(self.screen)
-                self.player.bullets.draw(self.screen)
-                self.particle_system.draw(self.screen)
-                self.show_hud()
-            elif self.state == GameState.UPGRADE:
-                self.show_upgrade_menu()
-            elif self.state == GameState.GAME_OVER:
-                self.show_game_over()
-            elif self.state == GameState.VICTORY:
-                self.show_victory_screen()
-
-            pygame.display.flip()
+            if self.state == GameState.GAME:
+                self.draw_game()
+            else:
+                # Each screen clears to the background and flips by itself
+                if self.state == GameState.MENU:
+                    self.show_menu()
+                elif self.state == GameState.STORY:
+                    self.show_story()
+                elif self.state == GameState.UPGRADE:
+                    self.show_upgrade_menu()
+                elif self.state == GameState.GAME_OVER:
+                    self.show_game_over()
+                elif self.state == GameState.VICTORY:
+                    self.show_victory_screen()
+                self._full_redraw = True
 
         pygame.quit()
         sys.exit()